@@ -54,6 +54,13 @@ class AcknowledgementRequest(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if failed")
 
 
+class AcknowledgementBatchRequest(BaseModel):
+    """Request model for batched device execution acknowledgements."""
+    acks: List[AcknowledgementRequest] = Field(
+        ..., min_length=1, description="Acknowledgements in submission order"
+    )
+
+
 def get_device_service() -> DeviceService:
     """Dependency injection for device service."""
     return DeviceService()
@@ -202,6 +209,58 @@ async def submit_acknowledgement(
         )
 
 
+@router.post("/{device_id}/acknowledgements/batch", status_code=status.HTTP_202_ACCEPTED)
+async def submit_acknowledgement_batch(
+    device_id: str,
+    batch_request: AcknowledgementBatchRequest,
+    service: DeviceService = Depends(get_device_service)
+):
+    """
+    Submit a batch of execution acknowledgements from a device.
+
+    Devices buffer acknowledgements locally and deliver them in batches;
+    this records each result in one request instead of one per execution.
+    """
+    logger.info(
+        f"Received acknowledgement batch from {device_id} "
+        f"({len(batch_request.acks)} acks)"
+    )
+
+    for ack in batch_request.acks:
+        if ack.device_id != device_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="device_id in URL and body must match"
+            )
+
+    try:
+        await service.process_acknowledgement_batch(
+            device_id=device_id,
+            acknowledgements=[ack.model_dump() for ack in batch_request.acks]
+        )
+
+        logger.info(f"Acknowledgement batch processed for {device_id}")
+
+        return {
+            "status": "accepted",
+            "device_id": device_id,
+            "count": len(batch_request.acks),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Failed to process acknowledgement batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to process acknowledgement batch"
+        )
+
+
 @router.get("", response_model=List[DeviceResponse])
 async def list_devices(
     limit: int = Query(100, ge=1, le=1000),
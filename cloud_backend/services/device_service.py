@@ -157,6 +157,35 @@ class DeviceService:
             )
 
 
+    async def process_acknowledgement_batch(
+        self,
+        device_id: str,
+        acknowledgements: List[dict]
+    ):
+        """
+        Process a batch of device execution acknowledgements.
+
+        Updates last_seen once for the whole batch, then fans out to
+        the same per-acknowledgement handling as the single-ack path.
+
+        Args:
+            device_id: Device identifier
+            acknowledgements: Acknowledgement dicts in submission order
+        """
+        await self.update_last_seen(device_id)
+
+        for ack in acknowledgements:
+            logger.info(
+                f"Processed acknowledgement from {device_id}: "
+                f"entry={ack['schedule_entry_index']}, status={ack['status']}"
+            )
+
+            if ack["status"] == "failed":
+                logger.warning(
+                    f"Device {device_id} execution failed: "
+                    f"{ack.get('error_message')}"
+                )
+
     async def list_devices(
         self,
         limit: int = 100,
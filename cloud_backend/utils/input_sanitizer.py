@@ -13,6 +13,16 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Bounded quantifiers (64-char local part, 253-char domain per RFC 5321)
+# prevent catastrophic backtracking on hostile inputs.
+_EMAIL_RE = re.compile(
+    r"\A[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24}\Z"
+)
+
+# The {1,100} quantifier folds the length limit into the pattern, so one
+# fullmatch replaces the old format check + separate length check.
+_DEVICE_ID_RE = re.compile(r"\A[A-Z0-9_-]{1,100}\Z")
+
 
 def sanitize_string(value: str, max_length: Optional[int] = None) -> str:
     """
@@ -63,12 +73,13 @@ def sanitize_email(email: str) -> str:
         ValueError: If email is invalid
     """
     email = email.strip().lower()
-    
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    
-    if not re.match(email_pattern, email):
+
+    if len(email) > 254:
+        raise ValueError("Email too long")
+
+    if not _EMAIL_RE.fullmatch(email):
         raise ValueError("Invalid email format")
-    
+
     return email
 
 
@@ -115,13 +126,10 @@ def sanitize_device_id(device_id: str) -> str:
         device_id = str(device_id)
     
     device_id = device_id.strip()
-    
-    if not re.match(r"^[A-Z0-9_-]+$", device_id):
+
+    if not _DEVICE_ID_RE.fullmatch(device_id):
         raise ValueError("Invalid device ID format")
-    
-    if len(device_id) > 100:
-        raise ValueError("Device ID too long")
-    
+
     return device_id
 
 
@@ -148,6 +156,39 @@ def sanitize_json_input(data: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
         return data
 
 
+_ISO_TIMESTAMP_RE = re.compile(
+    r"\A\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?\Z"
+)
+
+
+def _validate_iso_timestamp(value: str, field: str) -> str:
+    """
+    Validate that a value is an ISO8601 timestamp string.
+
+    Timestamps must literally match the ISO8601 shape, so there is no
+    need to HTML-escape or pattern-scrub them — anything that fails the
+    regex is rejected outright.
+
+    Args:
+        value: Timestamp string
+        field: Field name for error reporting
+
+    Returns:
+        The validated timestamp string
+
+    Raises:
+        ValueError: If the value is not a valid ISO8601 timestamp
+    """
+    # The length check bounds regex work on hostile inputs; the
+    # fullmatch must then cover the entire value, or a valid-looking
+    # prefix would smuggle arbitrary trailing content through unescaped.
+    if not isinstance(value, str) or len(value) > 50 \
+            or not _ISO_TIMESTAMP_RE.fullmatch(value):
+        raise ValueError(f"{field} must be an ISO8601 timestamp")
+
+    return value
+
+
 def validate_schedule_entry_input(entry: Dict) -> Dict:
     """
     Validate and sanitize schedule entry input.
@@ -171,8 +212,8 @@ def validate_schedule_entry_input(entry: Dict) -> Dict:
             raise ValueError(f"Missing required field: {field}")
     
     sanitized = {
-        "start_time": sanitize_string(entry["start_time"], max_length=50),
-        "end_time": sanitize_string(entry["end_time"], max_length=50),
+        "start_time": _validate_iso_timestamp(entry["start_time"], "start_time"),
+        "end_time": _validate_iso_timestamp(entry["end_time"], "end_time"),
         "mode": int(entry["mode"]) if isinstance(entry["mode"], (int, str)) else None,
         "rate_kw": float(entry["rate_kw"]) if isinstance(entry["rate_kw"], (int, float, str)) else None
     }
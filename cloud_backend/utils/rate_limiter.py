@@ -9,6 +9,7 @@ import logging
 import time
 from typing import Optional
 
+import cachetools
 import redis
 from fastapi import HTTPException, Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -20,11 +21,40 @@ settings = get_settings()
 
 redis_client: Optional[redis.Redis] = None
 
+# Atomically increments the minute/hour/burst counters and returns the new
+# values in one round-trip. ARGV[1] is the number of locally-buffered
+# requests being flushed (see the TTLCache pre-filter below). EXPIRE is
+# only set when a counter is created, so steady-state traffic does a
+# single INCRBY per window instead of INCR + EXPIRE pairs.
+RATE_LIMIT_SCRIPT = """
+local n = tonumber(ARGV[1])
+local m = redis.call('INCRBY', KEYS[1], n)
+if m == n then redis.call('EXPIRE', KEYS[1], 60) end
+local h = redis.call('INCRBY', KEYS[2], n)
+if h == n then redis.call('EXPIRE', KEYS[2], 3600) end
+local b = redis.call('INCRBY', KEYS[3], n)
+if b == n then redis.call('EXPIRE', KEYS[3], 1) end
+return {m, h, b}
+"""
+
+_rate_limit_script = None
+
+# Per-process pre-filter: counts requests locally so that well-under-limit
+# traffic only touches Redis every few requests. Keyed by
+# (ip, endpoint, minute) and holding (local_count, pending_since_sync).
+# Counts are slightly inaccurate across instances — bounded by
+# sync_interval * number_of_instances — which is acceptable slack for
+# abuse protection. Buffered requests are charged to the burst window of
+# the second they flush in, so a fast client's full request rate still
+# lands on the burst counter (attributed up to sync_interval requests
+# late) rather than one INCR per flush.
+_local_counts: cachetools.TTLCache = cachetools.TTLCache(maxsize=100_000, ttl=60)
+
 
 def get_redis_client() -> redis.Redis:
     """Get Redis client for rate limiting."""
     global redis_client
-    
+
     if redis_client is None:
         try:
             redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -32,10 +62,20 @@ def get_redis_client() -> redis.Redis:
         except Exception as e:
             logger.error(f"Failed to connect to Redis for rate limiting: {e}")
             raise
-    
+
     return redis_client
 
 
+def get_rate_limit_script():
+    """Get the registered rate-limiting Lua script (registered once)."""
+    global _rate_limit_script
+
+    if _rate_limit_script is None:
+        _rate_limit_script = get_redis_client().register_script(RATE_LIMIT_SCRIPT)
+
+    return _rate_limit_script
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware.
@@ -48,21 +88,28 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
-        burst_size: int = 10
+        burst_size: int = 10,
+        sync_interval: int = 10,
+        sync_buffer: int = 10
     ):
         """
         Initialize rate limiter.
-        
+
         Args:
             app: FastAPI application
             requests_per_minute: Max requests per minute per IP
             requests_per_hour: Max requests per hour per IP
             burst_size: Max burst requests allowed
+            sync_interval: Local requests buffered between Redis syncs
+            sync_buffer: Headroom below the minute limit at which every
+                request syncs to Redis again
         """
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         self.burst_size = burst_size
+        self.sync_interval = sync_interval
+        self.sync_buffer = sync_buffer
     
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting."""
@@ -73,52 +120,57 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         
         try:
-            redis_cli = get_redis_client()
-            
-            minute_key = f"rate_limit:minute:{client_ip}:{endpoint}"
-            hour_key = f"rate_limit:hour:{client_ip}:{endpoint}"
+            now = time.time()
+            current_minute = int(now / 60)
+            current_hour = int(now / 3600)
+
+            local_key = (client_ip, endpoint, current_minute)
+            local_count, pending = _local_counts.get(local_key, (0, 0))
+            local_count += 1
+            pending += 1
+
+            near_limit = local_count >= self.requests_per_minute - self.sync_buffer
+            if not near_limit and pending < self.sync_interval:
+                _local_counts[local_key] = (local_count, pending)
+                return await call_next(request)
+
+            _local_counts[local_key] = (local_count, 0)
+
+            script = get_rate_limit_script()
+
+            minute_key = f"rate_limit:minute:{client_ip}:{endpoint}:{current_minute}"
+            hour_key = f"rate_limit:hour:{client_ip}:{endpoint}:{current_hour}"
             burst_key = f"rate_limit:burst:{client_ip}:{endpoint}"
-            
-            current_minute = int(time.time() / 60)
-            current_hour = int(time.time() / 3600)
-            
-            minute_count = redis_cli.get(f"{minute_key}:{current_minute}")
-            hour_count = redis_cli.get(f"{hour_key}:{current_hour}")
-            burst_count = redis_cli.get(burst_key)
-            
-            if minute_count and int(minute_count) >= self.requests_per_minute:
+
+            minute_count, hour_count, burst_count = script(
+                keys=[minute_key, hour_key, burst_key],
+                args=[pending]
+            )
+
+            if minute_count > self.requests_per_minute:
                 logger.warning(f"Rate limit exceeded (minute): {client_ip} on {endpoint}")
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Rate limit exceeded. Please try again later.",
                     headers={"Retry-After": "60"}
                 )
-            
-            if hour_count and int(hour_count) >= self.requests_per_hour:
+
+            if hour_count > self.requests_per_hour:
                 logger.warning(f"Rate limit exceeded (hour): {client_ip} on {endpoint}")
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Rate limit exceeded. Please try again later.",
                     headers={"Retry-After": "3600"}
                 )
-            
-            if burst_count and int(burst_count) >= self.burst_size:
+
+            if burst_count > self.burst_size:
                 logger.warning(f"Burst limit exceeded: {client_ip} on {endpoint}")
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Too many requests. Please slow down.",
                     headers={"Retry-After": "10"}
                 )
-            
-            pipe = redis_cli.pipeline()
-            pipe.incr(f"{minute_key}:{current_minute}")
-            pipe.expire(f"{minute_key}:{current_minute}", 60)
-            pipe.incr(f"{hour_key}:{current_hour}")
-            pipe.expire(f"{hour_key}:{current_hour}", 3600)
-            pipe.incr(burst_key)
-            pipe.expire(burst_key, 1)
-            pipe.execute()
-        
+
         except redis.RedisError as e:
             logger.error(f"Redis error in rate limiting: {e}")
         
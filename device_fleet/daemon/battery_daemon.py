@@ -9,7 +9,8 @@ local schedule execution and communication with the cloud backend.
 """
 
 import asyncio
-import json
+import bisect
+import concurrent.futures
 import logging
 import sqlite3
 import time
@@ -18,6 +19,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import aiohttp
+import orjson
 import paho.mqtt.client as mqtt
 
 from device_fleet.utils.schedule_executor import ScheduleExecutor
@@ -26,6 +28,16 @@ from device_fleet.utils.validation import validate_schedule_locally
 logger = logging.getLogger(__name__)
 
 
+def _utc_now_iso() -> str:
+    """
+    Format the current UTC time as an ISO8601 string with Z suffix.
+
+    utcfromtimestamp + strftime avoids the tzinfo attribute lookups that
+    datetime.utcnow().isoformat() pays on every acknowledgement.
+    """
+    return datetime.utcfromtimestamp(time.time()).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
 class BatteryDaemon:
     """
     Main daemon class for battery schedule execution.
@@ -33,7 +45,14 @@ class BatteryDaemon:
     Handles schedule retrieval, local storage, command execution,
     and acknowledgement publishing.
     """
-    
+
+    LOG_FLUSH_SIZE = 32
+    MQTT_RECONNECT_MAX_DELAY = 60
+    ACK_BATCH_SIZE = 64
+    ACK_FLUSH_INTERVAL = 2.0
+    ACK_RETRY_MAX_DELAY = 60.0
+    STORE_COALESCE_DELAY = 0.5
+
     def __init__(
         self,
         device_id: str,
@@ -65,16 +84,56 @@ class BatteryDaemon:
         self.executor = ScheduleExecutor(device_id)
         self.mqtt_client = None
         self.running = False
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ack_queue: Optional[asyncio.Queue] = None
+        self._pending_schedules: List[List[Dict]] = []
+        self._store_flush_task: Optional[asyncio.Task] = None
+
+        # SQLite calls block on fsync; a single-worker executor keeps
+        # them off the event loop (SQLite is serial per connection
+        # anyway, so one thread is all the parallelism there is).
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db"
+        )
+        self._log_buffer: List[tuple] = []
+        self._parsed_schedule: List[tuple] = []
+        self._schedule_starts: List[float] = []
+        self._schedule_changed = asyncio.Event()
         
         self._init_database()
         self._init_mqtt()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a SQLite connection with tuned PRAGMAs.
+
+        WAL mode turns commits into append-only log writes and lets
+        readers proceed without blocking writers; synchronous=NORMAL
+        still survives crashes but skips most fsyncs — a large win on
+        slow Pi SD cards.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-2000;
+        """)
+        return conn
+
     def _init_database(self):
         """Initialize local SQLite database for schedule storage."""
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
+
+        # Keep one connection for the daemon's lifetime: reopening per
+        # call pays file-open and WAL-header reads and throws away the
+        # page cache each time.
+        self._db = self._connect()
+        conn = self._db
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -97,19 +156,99 @@ class BatteryDaemon:
                 error_message TEXT
             )
         """)
-        
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ack_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sent INTEGER DEFAULT 0
+            )
+        """)
+
+        # Delivered rows are deleted on the fly now; prune any flagged
+        # rows left behind by earlier versions that only marked them.
+        cursor.execute("DELETE FROM ack_outbox WHERE sent = 1")
+
         conn.commit()
-        conn.close()
-        
+
         logger.info(f"Database initialized at {self.db_path}")
     
     def _init_mqtt(self):
         """Initialize MQTT client for schedule reception."""
         self.mqtt_client = mqtt.Client(client_id=self.device_id)
-        
+
         self.mqtt_client.on_connect = self._on_mqtt_connect
         self.mqtt_client.on_message = self._on_mqtt_message
         self.mqtt_client.on_disconnect = self._on_mqtt_disconnect
+
+        # Integrate paho with the asyncio loop instead of loop_start()'s
+        # background thread: socket I/O is driven by add_reader/add_writer,
+        # so MQTT callbacks run on the event loop and can safely touch
+        # daemon state.
+        self.mqtt_client.on_socket_open = self._on_socket_open
+        self.mqtt_client.on_socket_close = self._on_socket_close
+        self.mqtt_client.on_socket_register_write = self._on_socket_register_write
+        self.mqtt_client.on_socket_unregister_write = self._on_socket_unregister_write
+
+    # The socket callbacks fire synchronously inside paho calls, which
+    # run on the event loop in steady state but on an executor thread
+    # during reconnect(). add_reader/add_writer are not thread-safe, so
+    # marshal every registration through call_soon_threadsafe — a no-op
+    # queue hop when already on the loop, and the only safe entry point
+    # from another thread.
+
+    def _on_socket_open(self, client, userdata, sock):
+        """Register the MQTT socket with the event loop for reads."""
+        self._loop.call_soon_threadsafe(
+            self._loop.add_reader, sock, client.loop_read
+        )
+
+    def _on_socket_close(self, client, userdata, sock):
+        """Unregister the MQTT socket from the event loop."""
+        self._loop.call_soon_threadsafe(self._loop.remove_reader, sock)
+
+    def _on_socket_register_write(self, client, userdata, sock):
+        """Register the MQTT socket for writes when paho has queued data."""
+        self._loop.call_soon_threadsafe(
+            self._loop.add_writer, sock, client.loop_write
+        )
+
+    def _on_socket_unregister_write(self, client, userdata, sock):
+        """Unregister the MQTT socket for writes."""
+        self._loop.call_soon_threadsafe(self._loop.remove_writer, sock)
+
+    async def _mqtt_misc_loop(self):
+        """
+        Drive paho's periodic housekeeping (keepalive, retries).
+
+        Also attempts reconnection while the client is disconnected,
+        which covers the initial connect after connect_async(). Failed
+        attempts back off exponentially up to MQTT_RECONNECT_MAX_DELAY
+        so an unreachable broker is not hammered every second.
+        """
+        reconnect_delay = 1
+
+        while self.running:
+            rc = self.mqtt_client.loop_misc()
+            if rc != mqtt.MQTT_ERR_SUCCESS:
+                try:
+                    # reconnect() blocks on DNS + TCP connect; run it on
+                    # a worker thread so an unreachable broker cannot
+                    # stall the event loop for the socket timeout.
+                    await self._loop.run_in_executor(
+                        None, self.mqtt_client.reconnect
+                    )
+                    reconnect_delay = 1
+                except Exception as e:
+                    logger.warning(f"MQTT reconnect failed: {e}")
+                    await asyncio.sleep(reconnect_delay)
+                    reconnect_delay = min(
+                        reconnect_delay * 2, self.MQTT_RECONNECT_MAX_DELAY
+                    )
+                    continue
+
+            await asyncio.sleep(1)
     
     def _on_mqtt_connect(self, client, userdata, flags, rc):
         """Handle MQTT connection."""
@@ -124,13 +263,16 @@ class BatteryDaemon:
     def _on_mqtt_message(self, client, userdata, msg):
         """Handle incoming MQTT messages."""
         try:
-            payload = json.loads(msg.payload.decode())
+            # orjson decodes straight from bytes, skipping the .decode() step.
+            payload = orjson.loads(msg.payload)
             logger.info(f"Received schedule via MQTT: {payload.get('device_id')}")
             
             if payload.get("device_id") == self.device_id:
                 schedule = payload.get("schedule", [])
                 self._process_schedule(schedule)
-        
+
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Malformed MQTT payload: {e}")
         except Exception as e:
             logger.error(f"Error processing MQTT message: {e}", exc_info=True)
     
@@ -143,18 +285,30 @@ class BatteryDaemon:
         logger.info(f"Starting battery daemon for device {self.device_id}")
         
         self.running = True
-        
-        try:
-            self.mqtt_client.connect(self.mqtt_broker, self.mqtt_port, 60)
-            self.mqtt_client.loop_start()
-        except Exception as e:
-            logger.error(f"Failed to connect to MQTT broker: {e}")
-        
+        self._loop = asyncio.get_running_loop()
+
+        # One session for the daemon's lifetime: keep-alive connections
+        # avoid a TCP/TLS handshake per poll and per acknowledgement.
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
+        self.mqtt_client.connect_async(self.mqtt_broker, self.mqtt_port, 60)
+
         await self._load_cached_schedule()
-        
+
+        self._ack_queue = asyncio.Queue()
+
         tasks = [
+            asyncio.create_task(self._mqtt_misc_loop()),
             asyncio.create_task(self._poll_schedules()),
             asyncio.create_task(self._execute_schedule_loop()),
+            asyncio.create_task(self._ack_flusher()),
             asyncio.create_task(self._health_check_loop())
         ]
         
@@ -171,14 +325,28 @@ class BatteryDaemon:
         self.running = False
         
         if self.mqtt_client:
-            self.mqtt_client.loop_stop()
             self.mqtt_client.disconnect()
+
+        if self._http:
+            await self._http.close()
+            self._http = None
+
+        if self._db:
+            self._flush_schedule_stores_now()
+            self._flush_execution_logs()
+            self._db_executor.shutdown(wait=True)
+            self._db.close()
+            self._db = None
     
     async def _poll_schedules(self):
         """Periodically poll cloud API for schedules."""
         while self.running:
             try:
                 await self._fetch_schedule()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Transient network failures are expected under flaps;
+                # skip the traceback walk that exc_info would cost.
+                logger.warning(f"Error polling schedule: {e}")
             except Exception as e:
                 logger.error(f"Error polling schedule: {e}", exc_info=True)
             
@@ -189,21 +357,26 @@ class BatteryDaemon:
         url = f"{self.api_base_url}/schedules/{self.device_id}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        schedule = data.get("schedule", [])
-                        
-                        if schedule:
-                            self._process_schedule(schedule)
-                    elif response.status == 404:
-                        logger.warning(f"No schedule found for device {self.device_id}")
-                    else:
-                        logger.error(f"Failed to fetch schedule: {response.status}")
+            async with self._http.get(url) as response:
+                if response.status == 200:
+                    # Read raw bytes and let orjson decode them directly,
+                    # skipping aiohttp's charset detection and str
+                    # intermediate (and any content-type strictness).
+                    body = await response.read()
+                    data = orjson.loads(body)
+                    schedule = data.get("schedule", [])
+
+                    if schedule:
+                        self._process_schedule(schedule)
+                elif response.status == 404:
+                    logger.warning(f"No schedule found for device {self.device_id}")
+                else:
+                    logger.error(f"Failed to fetch schedule: {response.status}")
         
         except asyncio.TimeoutError:
             logger.warning("Schedule fetch timeout, using cached schedule")
+        except aiohttp.ClientError as e:
+            logger.warning(f"Schedule fetch failed: {e}")
         except Exception as e:
             logger.error(f"Error fetching schedule: {e}", exc_info=True)
     
@@ -214,96 +387,229 @@ class BatteryDaemon:
         Args:
             schedule: List of schedule entries
         """
-        is_valid, errors = validate_schedule_locally(schedule)
-        
+        is_valid, errors, parsed = validate_schedule_locally(schedule)
+
         if not is_valid:
             logger.error(f"Invalid schedule received: {errors}")
             return
-        
+
         self.current_schedule = schedule
-        self._store_schedule(schedule)
-        
+        self._build_parsed_schedule(schedule, parsed)
+        self._queue_schedule_store(schedule)
+
         logger.info(f"Schedule processed: {len(schedule)} entries")
+
+    def _queue_schedule_store(self, schedule: List[Dict]):
+        """
+        Coalesce rapid schedule arrivals into one batched store.
+
+        A retained MQTT message racing the HTTP poll (or a reconnect
+        burst) can deliver several schedule versions within a second;
+        buffering them for STORE_COALESCE_DELAY lets one transaction —
+        one fsync — persist the whole burst.
+        """
+        self._pending_schedules.append(schedule)
+
+        if self._loop is None:
+            self._flush_schedule_stores_now()
+        elif self._store_flush_task is None or self._store_flush_task.done():
+            self._store_flush_task = self._loop.create_task(
+                self._flush_schedule_stores()
+            )
+
+    async def _run_db(self, fn, *args):
+        """Run a blocking SQLite operation on the dedicated DB thread."""
+        return await self._loop.run_in_executor(self._db_executor, fn, *args)
+
+    async def _flush_schedule_stores(self):
+        """Wait out the coalescing window, then persist pending schedules."""
+        await asyncio.sleep(self.STORE_COALESCE_DELAY)
+        await self._run_db(self._flush_schedule_stores_now)
+
+    def _flush_schedule_stores_now(self):
+        schedules, self._pending_schedules = self._pending_schedules, []
+        if schedules:
+            self._store_schedules_batch(schedules)
+
+    def _build_parsed_schedule(self, schedule: List[Dict], parsed: List[tuple]):
+        """
+        Index the epoch tuples produced during validation.
+
+        Validation already parsed every timestamp, so the executor only
+        needs the tuples sorted by start time; the sorted order lets it
+        find the active entry with a bisect instead of a linear scan.
+        """
+        indexed = [
+            (start_ts, end_ts, i, entry)
+            for i, ((start_ts, end_ts, _, _), entry) in enumerate(
+                zip(parsed, schedule)
+            )
+        ]
+
+        indexed.sort(key=lambda p: p[0])
+        self._parsed_schedule = indexed
+        self._schedule_starts = [p[0] for p in indexed]
+        self._schedule_changed.set()
     
-    def _store_schedule(self, schedule: List[Dict]):
-        """Store schedule in local database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+    def _store_schedules_batch(self, schedules: List[List[Dict]]):
+        """
+        Store one or more schedule versions in a single transaction.
+
+        All versions are inserted for audit; only the newest is marked
+        active. N versions cost one fsync instead of N.
+        """
+        rows = [
+            (self.device_id, orjson.dumps(s).decode(), "inactive")
+            for s in schedules[:-1]
+        ]
+        rows.append(
+            (self.device_id, orjson.dumps(schedules[-1]).decode(), "active")
+        )
+
         try:
-            cursor.execute("""
-                UPDATE schedules SET status = 'inactive'
-                WHERE device_id = ? AND status = 'active'
-            """, (self.device_id,))
-            
-            cursor.execute("""
-                INSERT INTO schedules (device_id, schedule_data, status)
-                VALUES (?, ?, ?)
-            """, (
-                self.device_id,
-                json.dumps(schedule),
-                "active"
-            ))
-            
-            conn.commit()
-            logger.debug("Schedule stored in local database")
-        
+            with self._db:
+                self._db.execute("""
+                    UPDATE schedules SET status = 'inactive'
+                    WHERE device_id = ? AND status = 'active'
+                """, (self.device_id,))
+
+                self._db.executemany("""
+                    INSERT INTO schedules (device_id, schedule_data, status)
+                    VALUES (?, ?, ?)
+                """, rows)
+
+            logger.debug(f"Stored {len(rows)} schedule version(s) in local database")
+
         except sqlite3.Error as e:
-            logger.error(f"Database error storing schedule: {e}")
-            conn.rollback()
-        
-        finally:
-            conn.close()
+            logger.error(f"Database error storing schedules: {e}")
+
+    def _log_execution(
+        self,
+        index: int,
+        status: str,
+        actual_rate_kw: Optional[float] = None,
+        error_message: Optional[str] = None
+    ):
+        """
+        Buffer an execution-log row for batched insertion.
+
+        Rows are flushed every LOG_FLUSH_SIZE entries so N log writes
+        cost one fsync instead of N.
+        """
+        self._log_buffer.append((
+            index,
+            _utc_now_iso(),
+            status,
+            actual_rate_kw,
+            error_message
+        ))
+
+        if len(self._log_buffer) >= self.LOG_FLUSH_SIZE:
+            if self._loop is not None:
+                self._loop.run_in_executor(
+                    self._db_executor, self._flush_execution_logs
+                )
+            else:
+                self._flush_execution_logs()
+
+    def _flush_execution_logs(self):
+        """Write buffered execution-log rows in a single transaction."""
+        if not self._log_buffer:
+            return
+
+        rows, self._log_buffer = self._log_buffer, []
+
+        try:
+            with self._db:
+                self._db.executemany("""
+                    INSERT INTO execution_logs
+                        (schedule_entry_index, execution_time, status,
+                         actual_rate_kw, error_message)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+
+            logger.debug(f"Flushed {len(rows)} execution log rows")
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error storing execution logs: {e}")
     
+    def _read_cached_schedule_row(self):
+        """Blocking read of the newest active schedule row."""
+        cursor = self._db.execute("""
+            SELECT schedule_data FROM schedules
+            WHERE device_id = ? AND status = 'active'
+            ORDER BY received_at DESC
+            LIMIT 1
+        """, (self.device_id,))
+
+        return cursor.fetchone()
+
     async def _load_cached_schedule(self):
         """Load cached schedule from local database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT schedule_data FROM schedules
-                WHERE device_id = ? AND status = 'active'
-                ORDER BY received_at DESC
-                LIMIT 1
-            """, (self.device_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                schedule = json.loads(row["schedule_data"])
+        row = await self._run_db(self._read_cached_schedule_row)
+        if row:
+            schedule = orjson.loads(row[0])
+            is_valid, errors, parsed = validate_schedule_locally(schedule)
+
+            if is_valid:
                 self.current_schedule = schedule
+                self._build_parsed_schedule(schedule, parsed)
                 logger.info(f"Loaded cached schedule: {len(schedule)} entries")
-        
-        finally:
-            conn.close()
+            else:
+                logger.error(f"Cached schedule failed validation: {errors}")
     
     async def _execute_schedule_loop(self):
-        """Main loop for executing scheduled commands."""
+        """
+        Main loop for executing scheduled commands.
+
+        Instead of a fixed 30s poll, sleeps until the next schedule
+        boundary (or indefinitely with no schedule) and is woken early
+        by _schedule_changed when a new schedule arrives. One wakeup per
+        boundary instead of one every 30s keeps the Pi idle between
+        entries and hits boundaries with sub-second precision.
+        """
         while self.running:
             if self.current_schedule:
                 await self._check_and_execute()
-            
-            await asyncio.sleep(30)
+
+            next_ts = self._next_boundary(time.time())
+            delay = max(0.05, next_ts - time.time()) if next_ts else None
+
+            try:
+                await asyncio.wait_for(self._schedule_changed.wait(), timeout=delay)
+                self._schedule_changed.clear()
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_boundary(self, now_ts: float) -> Optional[float]:
+        """Earliest schedule start or end strictly after now_ts."""
+        best = None
+
+        for start_ts, end_ts, _, _ in self._parsed_schedule:
+            if start_ts > now_ts and (best is None or start_ts < best):
+                best = start_ts
+                # Entries are sorted by start; later boundaries can't beat this.
+                break
+            if end_ts > now_ts and (best is None or end_ts < best):
+                best = end_ts
+
+        return best
     
     async def _check_and_execute(self):
         """Check current time against schedule and execute if needed."""
-        if not self.current_schedule:
+        if not self._parsed_schedule:
             return
-        
-        now = datetime.utcnow()
-        
-        for i, entry in enumerate(self.current_schedule):
-            start_time = datetime.fromisoformat(
-                entry["start_time"].replace("Z", "+00:00")
-            )
-            end_time = datetime.fromisoformat(
-                entry["end_time"].replace("Z", "+00:00")
-            )
-            
-            if start_time <= now < end_time:
-                await self._execute_entry(i, entry)
-                break
+
+        now_ts = time.time()
+
+        # Last entry whose start is <= now; entries are sorted by start.
+        pos = bisect.bisect_right(self._schedule_starts, now_ts) - 1
+        if pos < 0:
+            return
+
+        start_ts, end_ts, index, entry = self._parsed_schedule[pos]
+        if start_ts <= now_ts < end_ts:
+            await self._execute_entry(index, entry)
     
     async def _execute_entry(self, index: int, entry: Dict):
         """Execute a schedule entry."""
@@ -321,20 +627,25 @@ class BatteryDaemon:
             )
             
             if success:
+                self._log_execution(index, "success", actual_rate_kw=actual_rate)
                 await self._send_acknowledgement(
                     index=index,
                     status="success",
                     actual_rate_kw=actual_rate
                 )
             else:
+                self._log_execution(
+                    index, "failed", error_message="Command execution failed"
+                )
                 await self._send_acknowledgement(
                     index=index,
                     status="failed",
                     error_message="Command execution failed"
                 )
-        
+
         except Exception as e:
             logger.error(f"Error executing entry {index}: {e}", exc_info=True)
+            self._log_execution(index, "failed", error_message=str(e))
             await self._send_acknowledgement(
                 index=index,
                 status="failed",
@@ -348,34 +659,120 @@ class BatteryDaemon:
         actual_rate_kw: Optional[float] = None,
         error_message: Optional[str] = None
     ):
-        """Send execution acknowledgement to cloud backend."""
+        """Persist an execution acknowledgement for batched delivery."""
         ack = {
             "device_id": self.device_id,
             "schedule_entry_index": index,
-            "execution_time": datetime.utcnow().isoformat() + "Z",
+            "execution_time": _utc_now_iso(),
             "status": status,
             "actual_rate_kw": actual_rate_kw,
             "error_message": error_message
         }
-        
+
+        # Outbox pattern: write the ack durably first so a network blip
+        # or backend outage cannot lose it, then wake the flusher.
+        if not await self._run_db(self._insert_ack, ack):
+            return
+
+        await self._ack_queue.put(None)
+
+    def _insert_ack(self, ack: Dict) -> bool:
+        """Blocking insert of an acknowledgement into the outbox."""
         try:
-            url = f"{self.api_base_url}/devices/{self.device_id}/acknowledgements"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=ack,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 202:
-                        logger.debug(f"Acknowledgement sent for entry {index}")
-                    else:
-                        logger.warning(
-                            f"Failed to send acknowledgement: {response.status}"
-                        )
-        
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO ack_outbox (payload) VALUES (?)",
+                    (orjson.dumps(ack).decode(),)
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Database error storing acknowledgement: {e}")
+            return False
+
+    async def _ack_flusher(self):
+        """
+        Deliver pending acknowledgements from the outbox in batches.
+
+        Collects up to ACK_BATCH_SIZE unsent rows per POST, deleting
+        them only after the backend accepts the batch. Failed deliveries
+        are retried with exponential backoff up to ACK_RETRY_MAX_DELAY,
+        so acks survive backend outages instead of being logged and
+        dropped.
+        """
+        retry_delay = 1.0
+
+        while self.running:
+            rows = await self._run_db(self._fetch_unsent_acks)
+
+            if not rows:
+                try:
+                    await asyncio.wait_for(self._ack_queue.get(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    pass
+                # Brief pause so a burst of acks coalesces into one batch.
+                await asyncio.sleep(self.ACK_FLUSH_INTERVAL)
+                continue
+
+            batch = [orjson.loads(payload) for _, payload in rows]
+
+            if await self._post_ack_batch(batch):
+                await self._run_db(
+                    self._delete_delivered_acks, [row_id for row_id, _ in rows]
+                )
+                retry_delay = 1.0
+            else:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.ACK_RETRY_MAX_DELAY)
+
+    def _fetch_unsent_acks(self) -> List[tuple]:
+        """Blocking read of the next batch of unsent outbox rows."""
+        return self._db.execute("""
+            SELECT id, payload FROM ack_outbox
+            WHERE sent = 0
+            ORDER BY id
+            LIMIT ?
+        """, (self.ACK_BATCH_SIZE,)).fetchall()
+
+    def _delete_delivered_acks(self, ids: List[int]):
+        """
+        Blocking delete of delivered outbox rows.
+
+        Rows are removed rather than flagged so the outbox only ever
+        holds undelivered acks and cannot grow without bound on the
+        device's SD card.
+        """
+        placeholders = ",".join("?" * len(ids))
+        with self._db:
+            self._db.execute(
+                f"DELETE FROM ack_outbox WHERE id IN ({placeholders})",
+                ids
+            )
+
+    async def _post_ack_batch(self, batch: List[Dict]) -> bool:
+        """POST a batch of acknowledgements to the cloud backend."""
+        url = f"{self.api_base_url}/devices/{self.device_id}/acknowledgements/batch"
+
+        try:
+            async with self._http.post(
+                url,
+                json={"acks": batch},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 202:
+                    logger.debug(f"Acknowledgement batch sent ({len(batch)} acks)")
+                    return True
+
+                logger.warning(
+                    f"Failed to send acknowledgement batch: {response.status}"
+                )
+                return False
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error sending acknowledgement batch: {e}")
+            return False
         except Exception as e:
-            logger.error(f"Error sending acknowledgement: {e}", exc_info=True)
+            logger.error(f"Error sending acknowledgement batch: {e}", exc_info=True)
+            return False
     
     async def _health_check_loop(self):
         """Periodic health check and status reporting."""
@@ -3,51 +3,128 @@ Local Schedule Validation
 
 Validation utilities for device-side schedule validation.
 Simplified version of cloud validation for local use.
+
+This module is kept fully type-annotated so it can be AOT-compiled with
+mypyc (scripts/build_validation_ext.sh); the compiled extension shadows
+this file on import and gateways relaying many schedules get the
+validator as native code. Without the extension the pure-Python version
+runs unchanged.
 """
 
-from typing import List, Optional, Tuple
+import calendar
+from datetime import datetime
+from typing import List, Tuple
+
+_REQUIRED_FIELDS = frozenset(("start_time", "end_time", "mode", "rate_kw"))
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_VALID_MODES = (1, 2)
+_NUMERIC_TYPES = (int, float)
+
+# Parsed schedule entry: (start_ts, end_ts, mode, rate_kw) epoch tuple.
+ParsedEntry = Tuple[float, float, int, float]
+
+
+def _parse_timestamp(value: str) -> float:
+    """
+    Parse an ISO8601 timestamp string to epoch seconds.
+
+    Fast path for the exact shape the backend emits
+    (YYYY-MM-DDTHH:MM:SSZ): slice the digit fields and convert with
+    calendar.timegm, skipping datetime/tzinfo object construction
+    entirely. Anything else falls back to fromisoformat.
+    """
+    if len(value) == 20 and value[19] == "Z" and value[4] == "-" and value[10] == "T":
+        try:
+            year = int(value[0:4])
+            month = int(value[5:7])
+            day = int(value[8:10])
+            hour = int(value[11:13])
+            minute = int(value[14:16])
+            second = int(value[17:19])
+            if 1 <= month <= 12 and hour < 24 and minute < 60 and second < 60:
+                # timegm silently normalizes out-of-range days (Feb 31
+                # becomes Mar 3), so check day against the real month
+                # length — including leap-year February — before
+                # trusting the slice parse.
+                max_day = _DAYS_IN_MONTH[month]
+                if month == 2 and year % 4 == 0 \
+                        and (year % 100 != 0 or year % 400 == 0):
+                    max_day = 29
+                if 1 <= day <= max_day:
+                    return float(calendar.timegm((
+                        year, month, day, hour, minute, second, 0, 0, 0
+                    )))
+        except ValueError:
+            pass
+
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
 
 
 def validate_schedule_locally(
     schedule: List[dict]
-) -> Tuple[bool, List[str]]:
+) -> Tuple[bool, List[str], List[ParsedEntry]]:
     """
     Validate schedule locally on device.
-    
+
+    Timestamps are parsed to epoch seconds as part of validation so the
+    executor can reuse them instead of re-parsing the ISO strings on its
+    hot path.
+
     Args:
         schedule: List of schedule entries
-    
+
     Returns:
-        Tuple of (is_valid, list_of_errors)
+        Tuple of (is_valid, list_of_errors, parsed_entries). The parsed
+        entries align one-to-one with the schedule when it is valid.
     """
-    errors = []
-    
+    errors: List[str] = []
+    parsed: List[ParsedEntry] = []
+    append_error = errors.append
+
     if not isinstance(schedule, list):
-        return False, ["Schedule must be a list"]
-    
+        return False, ["Schedule must be a list"], parsed
+
     if len(schedule) == 0:
-        return False, ["Schedule cannot be empty"]
-    
+        return False, ["Schedule cannot be empty"], parsed
+
     for i, entry in enumerate(schedule):
         if not isinstance(entry, dict):
-            errors.append(f"Entry {i}: must be a dictionary")
+            append_error(f"Entry {i}: must be a dictionary")
             continue
-        
-        required_fields = ["start_time", "end_time", "mode", "rate_kw"]
-        for field in required_fields:
-            if field not in entry:
-                errors.append(f"Entry {i}: missing field {field}")
-        
-        if "mode" in entry:
-            mode = entry["mode"]
-            if mode not in [1, 2]:
-                errors.append(f"Entry {i}: mode must be 1 or 2 (got {mode})")
-        
-        if "rate_kw" in entry:
-            rate = entry["rate_kw"]
-            if not isinstance(rate, (int, float)) or rate < 0 or rate > 1000:
-                errors.append(
-                    f"Entry {i}: rate_kw must be between 0 and 1000 (got {rate})"
-                )
-    
-    return len(errors) == 0, errors
+
+        missing = _REQUIRED_FIELDS - entry.keys()
+        if missing:
+            errors.extend(
+                f"Entry {i}: missing field {field}" for field in sorted(missing)
+            )
+            continue
+
+        entry_valid = True
+
+        mode = entry["mode"]
+        if mode not in _VALID_MODES:
+            append_error(f"Entry {i}: mode must be 1 or 2 (got {mode})")
+            entry_valid = False
+
+        rate = entry["rate_kw"]
+        if type(rate) not in _NUMERIC_TYPES or rate < 0 or rate > 1000:
+            append_error(
+                f"Entry {i}: rate_kw must be between 0 and 1000 (got {rate})"
+            )
+            entry_valid = False
+
+        try:
+            start_ts = _parse_timestamp(entry["start_time"])
+            end_ts = _parse_timestamp(entry["end_time"])
+        except (ValueError, TypeError, AttributeError):
+            append_error(f"Entry {i}: invalid timestamp format")
+            entry_valid = False
+        else:
+            if start_ts >= end_ts:
+                append_error(f"Entry {i}: start_time must be before end_time")
+                entry_valid = False
+
+        if entry_valid:
+            parsed.append((start_ts, end_ts, mode, float(rate)))
+
+    return len(errors) == 0, errors, parsed
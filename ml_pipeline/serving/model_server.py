@@ -36,6 +36,7 @@ class ModelServer:
         self.model_version: str = "unknown"
         self.model_path: Optional[str] = model_path
         self.loaded_at: Optional[datetime] = None
+        self._latest_model_cache: Optional[tuple] = None
     
     def load_model(self, model_path: Optional[str] = None):
         """
@@ -85,8 +86,12 @@ class ModelServer:
                 historical_demand,
                 device_history
             )
-            
-            predictions = self.model.predict(features)
+
+            # Hand the model a C-contiguous float32 matrix up front;
+            # sklearn would otherwise copy-convert the DataFrame
+            # internally on every call.
+            X = np.ascontiguousarray(features.to_numpy(dtype=np.float32))
+            predictions = self.model.predict_fast(X)
             
             schedule = self._predictions_to_schedule(predictions)
             
@@ -107,40 +112,62 @@ class ModelServer:
         Returns:
             List of schedule entries
         """
-        schedule = []
         base_time = datetime.utcnow().replace(
             hour=0, minute=0, second=0, microsecond=0
         )
-        
-        for i, pred in enumerate(predictions[:48]):
-            start_time = base_time + pd.Timedelta(minutes=30 * i)
-            end_time = start_time + pd.Timedelta(minutes=30)
-            
-            mode = 1 if pred > 0 else 2
-            rate_kw = abs(pred)
-            
-            schedule.append({
-                "start_time": start_time.isoformat() + "Z",
-                "end_time": end_time.isoformat() + "Z",
-                "mode": mode,
-                "rate_kw": min(rate_kw, 1000.0)
-            })
-        
-        return schedule
+
+        preds = np.asarray(predictions[:48])
+
+        # One date_range + vectorized mode/rate computation instead of a
+        # Python loop with a Timedelta and isoformat per entry.
+        starts = pd.date_range(base_time, periods=len(preds), freq="30min")
+        ends = starts + pd.Timedelta(minutes=30)
+
+        modes = np.where(preds > 0, 1, 2)
+        rates = np.minimum(np.abs(preds), 1000.0)
+
+        start_iso = starts.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_iso = ends.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        return [
+            {
+                "start_time": s,
+                "end_time": e,
+                "mode": int(m),
+                "rate_kw": float(r)
+            }
+            for s, e, m, r in zip(start_iso, end_iso, modes, rates)
+        ]
     
     def _find_latest_model(self) -> Optional[str]:
-        """Find the latest model file."""
+        """
+        Find the latest model file.
+
+        The resolved path is cached keyed on the models directory's
+        mtime — bumped by any add, remove or rename — so repeated calls
+        cost one stat() of the directory instead of a glob plus a
+        stat() per artifact, while newly published models are still
+        picked up on the next call.
+        """
         model_dir = Path("ml_pipeline/models")
-        
-        if not model_dir.exists():
+
+        try:
+            dir_mtime = model_dir.stat().st_mtime
+        except OSError:
             return None
-        
+
+        if self._latest_model_cache is not None:
+            cached_path, cached_dir_mtime = self._latest_model_cache
+            if cached_dir_mtime == dir_mtime:
+                return cached_path
+
         model_files = list(model_dir.glob("*.pkl"))
-        
+
         if not model_files:
             return None
-        
+
         latest = max(model_files, key=lambda p: p.stat().st_mtime)
+        self._latest_model_cache = (str(latest), dir_mtime)
         return str(latest)
     
     def get_status(self) -> Dict:
@@ -153,6 +180,25 @@ class ModelServer:
         }
 
 
+_model_server: Optional[ModelServer] = None
+
+
+def get_model_server() -> ModelServer:
+    """
+    Get the shared process-wide ModelServer.
+
+    Serving paths should use this instead of constructing their own
+    instance so the loaded model (and its warm caches) are reused across
+    requests.
+    """
+    global _model_server
+
+    if _model_server is None:
+        _model_server = ModelServer()
+
+    return _model_server
+
+
 def main():
     """Example usage."""
     logging.basicConfig(
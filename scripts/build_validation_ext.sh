@@ -0,0 +1,17 @@
+#!/bin/bash
+
+set -e
+
+# Compiles the device-side schedule validator to a C extension with
+# mypyc (bundled with the mypy dev dependency). The compiled module
+# shadows the pure-Python one on import, so devices without the
+# extension built simply fall back to the interpreted version.
+
+echo "Building compiled schedule validator with mypyc..."
+
+command -v python3 >/dev/null 2>&1 || { echo "Error: python3 is required but not installed." >&2; exit 1; }
+python3 -c "import mypyc" >/dev/null 2>&1 || { echo "Error: mypy (with mypyc) is required. Run: pip install mypy" >&2; exit 1; }
+
+python3 -m mypyc device_fleet/utils/validation.py
+
+echo "Done. Remove the generated .so next to validation.py to revert to pure Python."
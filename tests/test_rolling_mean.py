@@ -0,0 +1,68 @@
+"""
+Regression tests for the rolling-mean implementations.
+
+The scipy uniform_filter1d tier must produce a trailing window
+identical to the cumsum fallback and to pandas' rolling(...).mean();
+a flipped origin sign silently leaks future samples into every
+engineered feature.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_pipeline.training import train_model
+
+
+@pytest.fixture
+def series():
+    return np.random.default_rng(42).normal(size=500)
+
+
+def _cumsum_rolling(arr, window):
+    c = np.concatenate(([0.0], np.cumsum(arr, dtype=np.float64)))
+    out = (c[window:] - c[:-window]) / window
+    return np.concatenate((np.full(window - 1, np.nan), out))
+
+
+@pytest.mark.parametrize("window", [3, 24, 168])
+def test_rolling_mean_matches_cumsum(series, window):
+    out = train_model._rolling_mean(series, window)
+    expected = _cumsum_rolling(series, window)
+
+    assert np.all(np.isnan(out[:window - 1]))
+    np.testing.assert_allclose(out[window - 1:], expected[window - 1:])
+
+
+@pytest.mark.parametrize("window", [3, 24, 168])
+def test_rolling_mean_matches_pandas(series, window):
+    out = train_model._rolling_mean(series, window)
+    expected = pd.Series(series).rolling(window).mean().to_numpy()
+
+    np.testing.assert_allclose(out[window - 1:], expected[window - 1:])
+
+
+def test_rolling_mean_is_trailing_not_forward_looking(series):
+    # The last output must depend only on past samples: perturbing the
+    # final element may change only the final window's means.
+    window = 24
+    before = train_model._rolling_mean(series, window)
+
+    perturbed = series.copy()
+    perturbed[-1] += 100.0
+    after = train_model._rolling_mean(perturbed, window)
+
+    np.testing.assert_allclose(before[:-1], after[:-1])
+    assert before[-1] != after[-1]
+
+
+@pytest.mark.parametrize("windows", [[24], [24, 168]])
+def test_rolling_columns_match_rolling_mean(series, windows):
+    train_model._rolling_cache.clear()
+    cols = train_model._rolling_columns(series, windows)
+
+    for window, col in zip(windows, cols):
+        expected = train_model._rolling_mean(series, window)
+        np.testing.assert_allclose(
+            col[window - 1:], expected[window - 1:]
+        )